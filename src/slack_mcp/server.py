@@ -1,6 +1,8 @@
 """MCP server implementation for Slack."""
 
 import asyncio
+import contextlib
+import logging
 from dotenv import load_dotenv
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -8,6 +10,8 @@ from mcp.types import Resource, TextContent, Tool
 from slack_mcp.slack_client import SlackClient, SlackMCPError
 from slack_mcp.tools import get_tools, handle_tool_call
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
@@ -22,6 +26,12 @@ except SlackMCPError as e:
 # Create MCP server
 app = Server("slack-mcp-server")
 
+# Backpressure: the MCP SDK spawns one task per incoming request without limit,
+# so a burst of calls against slow Slack responses would pile up in memory
+# Only this many tool calls run at once; the rest wait their turn
+MAX_CONCURRENT_TOOL_CALLS = 16
+_tool_call_slots = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
@@ -41,7 +51,8 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
                 text="Error: Slack client not initialized. Check SLACK_BOT_TOKEN environment variable.",
             )
         ]
-    return await handle_tool_call(name, arguments, slack_client)
+    async with _tool_call_slots:
+        return await handle_tool_call(name, arguments, slack_client)
 
 
 @app.list_resources()
@@ -51,14 +62,44 @@ async def list_resources() -> list[Resource]:
     return []
 
 
+async def _warm_up(client: SlackClient) -> None:
+    """Validate the token and open a pooled connection before the first tool call."""
+    # Best effort only: real tool calls report their own errors, but a bad token
+    # is worth flagging at startup. Logging goes to stderr, off the stdout protocol
+    try:
+        ok = await client.test_connection()
+    except Exception as e:
+        logger.warning("Slack warm-up failed: %s: %s", type(e).__name__, e)
+        return
+    if not ok:
+        logger.warning("SLACK_BOT_TOKEN was rejected by auth.test")
+
+
+async def _shutdown(client: SlackClient, warm_up: asyncio.Task | None) -> None:
+    """Stop the warm-up and release pooled Slack connections."""
+    if warm_up is not None:
+        # Let a cancelled auth.test unwind before its session is closed
+        warm_up.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await warm_up
+    await client.aclose()
+
+
 async def main():
     """Main entry point for the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options(),
-        )
+    # Pay the TLS handshake + auth round-trip in the background while the MCP
+    # client initializes, so the first tool call reuses a warm connection
+    warm_up = asyncio.create_task(_warm_up(slack_client)) if slack_client is not None else None
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options(),
+            )
+    finally:
+        if slack_client is not None:
+            await _shutdown(slack_client, warm_up)
 
 
 if __name__ == "__main__":
@@ -4,51 +4,131 @@ Slack client wrapper for an MCP server.
 Merges:
 - MCP-friendly, user-displayable errors (SlackMCPError)
 - Env-based config (SLACK_BOT_TOKEN, optional SLACK_ALLOWED_CHANNELS)
-- Single reused WebClient instance
+- Single reused AsyncWebClient instance (non-blocking I/O)
+- Shared keep-alive aiohttp connection pool
 - Safer posting via allowlist enforcement
 - Thread + search support
 - Optional pagination helpers
+- Short-lived TTL cache for read-mostly lookups (channels, users)
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, AsyncGenerator, Awaitable, Callable, Iterable, NamedTuple, Optional
 
-from slack_sdk import WebClient
+import aiohttp
+from cachetools import TTLCache
 from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+
+# Connection pool settings for the shared aiohttp session
+# Keep-alive lets consecutive Slack calls skip the TCP + TLS handshake
+_POOL_LIMIT = 100
+_POOL_LIMIT_PER_HOST = 50
+_KEEPALIVE_TIMEOUT = 75  # seconds
+
+# Read-mostly lookups (channel/user lists and info) are cached briefly
+# Channels and users rarely change minute-to-minute, while full listings can take seconds
+_CACHE_MAXSIZE = 256
+_CACHE_TTL = 60.0  # seconds
+
+# chat.postMessage rejects longer text; checking locally saves a wasted round-trip
+_MAX_MESSAGE_CHARS = 40000
+
+# Error message prefixes are built once per action rather than on every failure
+_ACTION_PREFIX = {
+    action: f"Slack API error ({action}): "
+    for action in (
+        "list_channels",
+        "get_channel_info",
+        "post_message",
+        "get_messages",
+        "get_thread",
+        "search_messages",
+        "get_users",
+        "get_user_info",
+    )
+}
 
 
 class SlackMCPError(RuntimeError):
     """Slack-related failures that are safe to show to the MCP client."""
 
 
-def _parse_allowed_channels(raw: str) -> set[str] | None:
-    # Split by comma, strip whitespace, filter empty strings, convert to set
+class PostResult(NamedTuple):
+    """Normalized result of post_message (handy for tool outputs)."""
+
+    ok: bool
+    channel: Optional[str]
+    ts: Optional[str]  # Message timestamp - use for threading
+    message: dict[str, Any]
+
+
+def _copy_result(value: Any) -> Any:
+    # Shallow copy is enough: callers replace list items but never mutate Slack objects
+    if isinstance(value, (list, dict)):
+        return value.copy()
+    return value
+
+
+def _normalize_channel(channel: str) -> str:
+    # "#General", "general" and " general " all refer to the same channel
+    return channel.strip().lstrip("#").lower()
+
+
+def _normalize_channels(channels: Iterable[str]) -> frozenset[str]:
+    # Normalize once up front so allowlist checks are a single frozenset lookup
+    return frozenset(_normalize_channel(c) for c in channels if c.strip())
+
+
+def _parse_allowed_channels(raw: str) -> frozenset[str] | None:
+    # Split by comma, normalize, filter empty strings, convert to frozenset
     # Empty set becomes None to distinguish "no channels" from "all channels allowed"
-    allowed = {c.strip() for c in (raw or "").split(",") if c.strip()}
+    allowed = _normalize_channels((raw or "").split(","))
     return allowed or None
 
 
 @dataclass(slots=True)
 class SlackClient:
-    """Wrapper around Slack WebClient for MCP server operations."""
+    """Wrapper around Slack AsyncWebClient for MCP server operations."""
 
     token: str  # Bot token (xoxb-...) required for all API operations
-    allowed_channels: set[str] | None = None  # Optional allowlist for posting safety
-    _client: WebClient = field(init=False, repr=False)  # Lazy-initialized API client
+    allowed_channels: frozenset[str] | None = None  # Optional allowlist for posting safety
+    # Lazy-initialized API client, created on first Slack call
+    _client: AsyncWebClient | None = field(default=None, init=False, repr=False)
+    _session: aiohttp.ClientSession | None = field(default=None, init=False, repr=False)
+    _cache: TTLCache = field(
+        default_factory=lambda: TTLCache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL),
+        init=False,
+        repr=False,
+    )
+    _cache_locks: dict[tuple[Any, ...], asyncio.Lock] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Callers holding or waiting on each lock; the last one out removes it
+    _cache_lock_users: dict[tuple[Any, ...], int] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Bumped by clear_cache() so fetches already in flight don't store stale results
+    _cache_generation: int = field(default=0, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        """Initialize WebClient after dataclass instantiation."""
-        # Critical: Token validation must happen before WebClient creation
+        """Validate configuration after dataclass instantiation."""
+        # Critical: Token validation must happen up front, even though the client is lazy
         # Empty tokens will cause authentication failures on all API calls
         if not self.token:
             raise SlackMCPError("Missing SLACK_BOT_TOKEN. Put it in your .env.")
-        
-        # Create WebClient instance - this is the main interface to Slack API
-        # WebClient handles HTTP requests, rate limiting, retries, and response parsing
-        self._client = WebClient(token=self.token)
+
+        # Store the allowlist normalized and immutable, whichever factory built us
+        if self.allowed_channels is not None:
+            self.allowed_channels = _normalize_channels(self.allowed_channels)
+
+        # AsyncWebClient is created on first API call (see _api), so sessions that
+        # only list tools never pay for SDK client / SSL / session setup
 
     @classmethod
     def from_env(cls) -> "SlackClient":
@@ -66,48 +146,159 @@ class SlackClient:
 
     @classmethod
     def from_token(
-        cls, bot_token: str, allowed_channels: set[str] | None = None
+        cls, bot_token: str, allowed_channels: Iterable[str] | None = None
     ) -> "SlackClient":
         """Factory method for programmatic instantiation (useful for testing)."""
         return cls(token=bot_token, allowed_channels=allowed_channels)
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session. Safe to call more than once."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            # Next API call rebuilds the client together with a fresh session
+            self._client = None
+
+    def clear_cache(self) -> None:
+        """Drop all cached lookups so the next call goes to Slack."""
+        self._cache.clear()
+        self._cache_generation += 1
+
+    async def cached(
+        self, key: tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Serve a lookup from the TTL cache, coalescing concurrent misses into one fetch.
+
+        Also usable by callers (e.g. tool handlers) to cache derived results under
+        their own keys; entries share the TTL and are dropped by clear_cache().
+        """
+        try:
+            return _copy_result(self._cache[key])
+        except KeyError:
+            pass
+
+        # Single-flight: concurrent callers for the same key wait on one lock,
+        # so only the first one actually hits the Slack API
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        self._cache_lock_users[key] = self._cache_lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                # Another caller may have filled the entry while we waited
+                try:
+                    value = self._cache[key]
+                except KeyError:
+                    generation = self._cache_generation
+                    value = await fetch()
+                    # A clear_cache() during the fetch means the result may predate
+                    # a write; return it to this caller but don't cache it
+                    if self._cache_generation == generation:
+                        self._cache[key] = value
+        finally:
+            # Drop the lock only once nobody holds or waits on it: a cancelled waiter
+            # must not remove it while another caller is still fetching
+            users = self._cache_lock_users[key] - 1
+            if users:
+                self._cache_lock_users[key] = users
+            else:
+                del self._cache_lock_users[key]
+                del self._cache_locks[key]
+
+        # Hand out a copy so callers can't mutate the cached entry
+        return _copy_result(value)
+
     # -------------------------
     # Internal helpers
     # -------------------------
+    def _api(self) -> AsyncWebClient:
+        """Return the API client, creating it with the shared pooled session on first use."""
+        if self._client is None:
+            # Without an explicit session AsyncWebClient opens (and closes) a new
+            # aiohttp session per request, paying a fresh TCP + TLS handshake each time
+            # The session must be created inside a running event loop, hence lazily here
+            connector = aiohttp.TCPConnector(
+                limit=_POOL_LIMIT,
+                limit_per_host=_POOL_LIMIT_PER_HOST,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._client = AsyncWebClient(token=self.token, session=self._session)
+        return self._client
+
     def _enforce_allowed_channel(self, channel: str) -> None:
         """Security check: Block posting outside an allowlist if configured."""
         # None means "no restrictions" - skip check
         # If allowlist exists, channel must be in it
-        if self.allowed_channels is not None and channel not in self.allowed_channels:
+        # Both sides are normalized, so "#General" matches an allowlist entry "general"
+        if (
+            self.allowed_channels is not None
+            and _normalize_channel(channel) not in self.allowed_channels
+        ):
             raise SlackMCPError(
                 f"Channel {channel} is not in SLACK_ALLOWED_CHANNELS. Add it to allow posting."
             )
 
     def _slack_error(self, action: str, e: SlackApiError) -> SlackMCPError:
         """Convert SlackApiError to user-friendly SlackMCPError."""
-        # SlackApiError.response is a SlackResponse object
-        # It usually contains an "error" field with error code/description
-        err = None
-        try:
-            # Try to extract structured error from response
-            err = e.response.get("error")
-        except Exception:
-            # If response structure is unexpected, fall back to exception string
-            err = None
-        
+        # SlackApiError.response is a SlackResponse object whose parsed payload
+        # (.data) usually contains an "error" field with the error code
+        data = getattr(e.response, "data", None)
+        err = data.get("error") if isinstance(data, dict) else None
+
         # Use extracted error if available, otherwise use exception message
         detail = err or str(e)
-        return SlackMCPError(f"Slack API error ({action}): {detail}")
+        prefix = _ACTION_PREFIX.get(action) or f"Slack API error ({action}): "
+        return SlackMCPError(prefix + detail)
+
+    async def _paginate(
+        self,
+        fetch_page: Callable[[Optional[str]], Awaitable[dict[str, Any]]],
+        key: str,
+        max_pages: int,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Follow next_cursor across pages, prefetching page K+1 while page K is consumed."""
+        pages = 1  # First page is fetched unconditionally
+        next_task: Optional[asyncio.Task[dict[str, Any]]] = None
+
+        try:
+            # Fetch the first page with no cursor
+            resp = await fetch_page(None)
+            while True:
+                # Schedule the next page as soon as its cursor is known, so the HTTP
+                # round-trip overlaps with the consumer processing the current page
+                # If no cursor, we've reached the last page
+                cursor = (resp.get("response_metadata") or {}).get("next_cursor") or None
+                next_task = None
+                if cursor and pages < max_pages:
+                    pages += 1
+                    next_task = asyncio.create_task(fetch_page(cursor))
+
+                # Hand out items from this page; at most this page and the prefetched
+                # next one are held at a time
+                for item in resp.get(key, []) or []:
+                    yield item
+
+                if next_task is None:
+                    break
+                resp = await next_task
+        finally:
+            # Consumer stopped early (or failed): don't leave a prefetch running
+            if next_task is not None and not next_task.done():
+                next_task.cancel()
+            elif next_task is not None and not next_task.cancelled():
+                # Already finished: retrieve any error so asyncio doesn't log it as
+                # "Task exception was never retrieved"
+                next_task.exception()
 
     # -------------------------
     # Connection / auth
     # -------------------------
-    def test_connection(self) -> bool:
+    async def test_connection(self) -> bool:
         """Lightweight token validation."""
         try:
             # auth_test() is the lightest API call - just validates token
             # Returns workspace info (team_id, user_id, etc.) if successful
-            resp = self._client.auth_test()
+            resp = await self._api().auth_test()
             # Check "ok" field - True means token is valid
             return bool(resp.get("ok", False))
         except SlackApiError:
@@ -118,7 +309,7 @@ class SlackClient:
     # -------------------------
     # Channels
     # -------------------------
-    def list_channels(
+    async def list_channels(
         self,
         *,
         limit: int = 200,
@@ -127,7 +318,7 @@ class SlackClient:
         cursor: Optional[str] = None,
     ) -> dict[str, Any]:
         """
-        List channels the bot can see. Returns the raw SlackResponse-like dict.
+        List channels the bot can see. Returns the raw response payload dict.
 
         Requires scopes: channels:read (public), groups:read (private) depending on types.
         """
@@ -135,77 +326,100 @@ class SlackClient:
             # conversations_list() retrieves conversations (channels, DMs, groups)
             # types parameter filters: "public_channel,private_channel" excludes DMs
             # cursor enables pagination - pass None for first page, then use next_cursor
-            resp = self._client.conversations_list(
+            resp = await self._api().conversations_list(
                 limit=limit,
                 types=types,
                 exclude_archived=exclude_archived,
                 cursor=cursor,
             )
-            # Return raw dict so caller can access response_metadata for pagination
-            return dict(resp)
+            # Return the parsed payload (no copy) so caller can access response_metadata
+            return resp.data
         except SlackApiError as e:
             # Convert to user-friendly error with context
             raise self._slack_error("list_channels", e) from e
 
-    def list_channels_all(
+    def list_channels_iter(
         self,
         *,
-        limit: int = 200,
+        limit: int = 1000,
         types: str = "public_channel,private_channel",
         exclude_archived: bool = True,
         max_pages: int = 50,
-    ) -> list[dict[str, Any]]:
-        """Convenience paginator to fetch many channels."""
-        channels: list[dict[str, Any]] = []
-        cursor: Optional[str] = None  # Start with no cursor (first page)
-        pages = 0  # Track pages for safety limit
-
-        # Pagination loop: continue until no more pages or max_pages reached
-        while pages < max_pages:
-            pages += 1
-            
-            # Fetch one page of channels
-            resp = self.list_channels(
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Yield channels page by page, so memory stays O(page) rather than O(total).
+
+        Not cached; use list_channels_all() for a cached, materialized list.
+        """
+        # Fetch one page of channels per cursor; pages are prefetched by _paginate
+        return self._paginate(
+            lambda cursor: self.list_channels(
                 limit=limit,
                 types=types,
                 exclude_archived=exclude_archived,
                 cursor=cursor,
+            ),
+            "channels",
+            max_pages,
+        )
+
+    async def list_channels_all(
+        self,
+        *,
+        limit: int = 1000,
+        types: str = "public_channel,private_channel",
+        exclude_archived: bool = True,
+        max_pages: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Convenience paginator to fetch many channels (cached for a short TTL)."""
+
+        async def fetch() -> list[dict[str, Any]]:
+            channels = self.list_channels_iter(
+                limit=limit,
+                types=types,
+                exclude_archived=exclude_archived,
+                max_pages=max_pages,
             )
-            
-            # Extract channels from this page and add to accumulator
-            channels.extend(resp.get("channels", []) or [])
-            
-            # Get next cursor from response_metadata for next iteration
-            # If no cursor, we've reached the last page
-            cursor = (resp.get("response_metadata") or {}).get("next_cursor") or None
-            if not cursor:
-                break
+            return [ch async for ch in channels]
 
-        return channels
+        return await self.cached(
+            ("list_channels_all", limit, types, exclude_archived, max_pages), fetch
+        )
 
-    def get_channel_info(self, channel_id: str) -> Optional[dict[str, Any]]:
-        """Get metadata for a single channel."""
-        try:
-            # conversations_info() gets detailed metadata for one conversation
-            # Requires channel ID (not name) - use channel name resolution if needed
-            resp = self._client.conversations_info(channel=channel_id)
-            
-            # Check "ok" status - False means channel not found or no access
-            if resp.get("ok"):
-                return resp.get("channel")
-            return None
-        except SlackApiError as e:
-            raise self._slack_error("get_channel_info", e) from e
+    async def get_channel_info(self, channel_id: str) -> Optional[dict[str, Any]]:
+        """Get metadata for a single channel (cached for a short TTL)."""
+
+        async def fetch() -> Optional[dict[str, Any]]:
+            try:
+                # conversations_info() gets detailed metadata for one conversation
+                # Requires channel ID (not name) - use channel name resolution if needed
+                resp = await self._api().conversations_info(channel=channel_id)
+
+                # The SDK raises SlackApiError on ok=False (e.g. channel_not_found),
+                # so reaching here means success
+                return resp.data.get("channel")
+            except SlackApiError as e:
+                raise self._slack_error("get_channel_info", e) from e
+
+        return await self.cached(("get_channel_info", channel_id), fetch)
 
     # -------------------------
     # Messaging
     # -------------------------
-    def post_message(self, channel: str, text: str) -> dict[str, Any]:
+    async def post_message(self, channel: str, text: str) -> PostResult:
         """
         Post a message as the bot (allowlist enforced if configured).
 
         Requires scope: chat:write
         """
+        # Fail fast on text Slack would reject anyway, before any network call
+        if not text or not text.strip():
+            raise SlackMCPError("Message text is empty. Provide some text to post.")
+        if len(text) > _MAX_MESSAGE_CHARS:
+            raise SlackMCPError(
+                f"Message text exceeds {_MAX_MESSAGE_CHARS} characters. Shorten or split it."
+            )
+
         # Security: Check allowlist before attempting to post
         # Raises SlackMCPError if channel is not allowed
         self._enforce_allowed_channel(channel)
@@ -214,18 +428,20 @@ class SlackClient:
             # chat_postMessage() sends message to channel
             # Channel can be ID or name - API resolves names automatically
             # Returns message metadata including timestamp (ts) for the sent message
-            resp = self._client.chat_postMessage(channel=channel, text=text)
+            resp = await self._api().chat_postMessage(channel=channel, text=text)
+            # Writes invalidate cached reads so callers never see pre-write state
+            self.clear_cache()
             # Return a normalized payload (handy for tool outputs)
-            return {
-                "ok": resp.get("ok", False),
-                "channel": resp.get("channel"),
-                "ts": resp.get("ts"),  # Message timestamp - use for threading
-                "message": resp.get("message", {}),
-            }
+            return PostResult(
+                resp.get("ok", False),
+                resp.get("channel"),
+                resp.get("ts"),
+                resp.get("message", {}),
+            )
         except SlackApiError as e:
             raise self._slack_error("post_message", e) from e
 
-    def get_messages(self, channel: str, limit: int = 100) -> list[dict[str, Any]]:
+    async def get_messages(self, channel: str, limit: int = 100) -> list[dict[str, Any]]:
         """
         Get recent messages from a channel.
 
@@ -235,16 +451,14 @@ class SlackClient:
             # conversations_history() retrieves message history
             # Messages returned newest-first (reverse chronological)
             # For >1000 messages, use pagination with cursor parameter
-            resp = self._client.conversations_history(channel=channel, limit=limit)
-            
-            # Extract messages list - empty list if no messages or error
-            if resp.get("ok"):
-                return resp.get("messages", []) or []
-            return []
+            resp = await self._api().conversations_history(channel=channel, limit=limit)
+
+            # Extract messages list - ok=False already raised SlackApiError in the SDK
+            return resp.data.get("messages") or []
         except SlackApiError as e:
             raise self._slack_error("get_messages", e) from e
 
-    def get_thread(
+    async def get_thread(
         self, channel: str, thread_ts: str, limit: int = 20
     ) -> list[dict[str, Any]]:
         """
@@ -256,17 +470,15 @@ class SlackClient:
             # conversations_replies() retrieves all messages in a thread
             # thread_ts is the timestamp of the parent message (from post_message response)
             # Returns parent message + all replies in chronological order
-            resp = self._client.conversations_replies(
+            resp = await self._api().conversations_replies(
                 channel=channel, ts=thread_ts, limit=limit
             )
-            
-            if resp.get("ok"):
-                return resp.get("messages", []) or []
-            return []
+
+            return resp.data.get("messages") or []
         except SlackApiError as e:
             raise self._slack_error("get_thread", e) from e
 
-    def search_messages(self, query: str, limit: int = 20) -> list[dict[str, Any]]:
+    async def search_messages(self, query: str, limit: int = 20) -> list[dict[str, Any]]:
         """
         Search messages (workspace settings may restrict search).
 
@@ -276,7 +488,7 @@ class SlackClient:
             # search_messages() performs workspace-wide message search
             # Query supports Slack search syntax (e.g., "from:user in:channel")
             # Note: Search may be restricted by workspace settings
-            resp = self._client.search_messages(query=query, count=limit)
+            resp = await self._api().search_messages(query=query, count=limit)
             
             # Response structure: {"messages": {"matches": [...]}}
             # Extract matches array, handling missing/empty responses gracefully
@@ -288,7 +500,7 @@ class SlackClient:
     # -------------------------
     # Users
     # -------------------------
-    def get_users(self, *, limit: int = 200, cursor: Optional[str] = None) -> dict[str, Any]:
+    async def get_users(self, *, limit: int = 200, cursor: Optional[str] = None) -> dict[str, Any]:
         """
         List users (paged). Returns the raw dict so caller can handle pagination.
 
@@ -298,48 +510,51 @@ class SlackClient:
             # users_list() retrieves workspace members
             # Returns active users, deactivated users, and bots
             # Use cursor for pagination in large workspaces
-            resp = self._client.users_list(limit=limit, cursor=cursor)
+            resp = await self._api().users_list(limit=limit, cursor=cursor)
             
-            # Return raw dict so caller can access response_metadata.next_cursor
-            return dict(resp)
+            # Return the parsed payload (no copy) so caller can access
+            # response_metadata.next_cursor
+            return resp.data
         except SlackApiError as e:
             raise self._slack_error("get_users", e) from e
 
-    def get_users_all(self, *, limit: int = 200, max_pages: int = 50) -> list[dict[str, Any]]:
-        """Convenience paginator to fetch many users."""
-        users: list[dict[str, Any]] = []
-        cursor: Optional[str] = None  # Start with no cursor (first page)
-        pages = 0  # Track pages for safety limit
-
-        # Pagination loop: continue until no more pages or max_pages reached
-        while pages < max_pages:
-            pages += 1
-            
-            # Fetch one page of users
-            resp = self.get_users(limit=limit, cursor=cursor)
-            
-            # Extract members from this page and add to accumulator
-            # "members" contains the list of user objects
-            users.extend(resp.get("members", []) or [])
-            
-            # Get next cursor from response_metadata for next iteration
-            # If no cursor, we've reached the last page
-            cursor = (resp.get("response_metadata") or {}).get("next_cursor") or None
-            if not cursor:
-                break
-
-        return users
+    def get_users_iter(
+        self, *, limit: int = 1000, max_pages: int = 50
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Yield users page by page, so memory stays O(page) rather than O(total).
 
-    def get_user_info(self, user_id: str) -> Optional[dict[str, Any]]:
-        """Get detailed info for a single user."""
-        try:
-            # users_info() retrieves detailed profile for one user
-            # Requires user ID (not username) - use user lookup if needed
-            resp = self._client.users_info(user=user_id)
-            
-            # Check "ok" status - False means user not found or no access
-            if resp.get("ok"):
-                return resp.get("user")
-            return None
-        except SlackApiError as e:
-            raise self._slack_error("get_user_info", e) from e
\ No newline at end of file
+        Not cached; use get_users_all() for a cached, materialized list.
+        """
+        # "members" contains the list of user objects on each page
+        return self._paginate(
+            lambda cursor: self.get_users(limit=limit, cursor=cursor),
+            "members",
+            max_pages,
+        )
+
+    async def get_users_all(self, *, limit: int = 1000, max_pages: int = 50) -> list[dict[str, Any]]:
+        """Convenience paginator to fetch many users (cached for a short TTL)."""
+
+        async def fetch() -> list[dict[str, Any]]:
+            users = self.get_users_iter(limit=limit, max_pages=max_pages)
+            return [user async for user in users]
+
+        return await self.cached(("get_users_all", limit, max_pages), fetch)
+
+    async def get_user_info(self, user_id: str) -> Optional[dict[str, Any]]:
+        """Get detailed info for a single user (cached for a short TTL)."""
+
+        async def fetch() -> Optional[dict[str, Any]]:
+            try:
+                # users_info() retrieves detailed profile for one user
+                # Requires user ID (not username) - use user lookup if needed
+                resp = await self._api().users_info(user=user_id)
+
+                # The SDK raises SlackApiError on ok=False (e.g. user_not_found),
+                # so reaching here means success
+                return resp.data.get("user")
+            except SlackApiError as e:
+                raise self._slack_error("get_user_info", e) from e
+
+        return await self.cached(("get_user_info", user_id), fetch)
\ No newline at end of file
@@ -1,104 +1,417 @@
 """MCP tools for Slack operations."""
 
-from typing import Any
+import asyncio
+import io
+from contextlib import aclosing
+from operator import itemgetter
+from typing import Any, AsyncGenerator, AsyncIterable, AsyncIterator, Awaitable, Callable, Optional
 from mcp.types import Tool, TextContent
 from slack_mcp.slack_client import SlackClient, SlackMCPError
 
+# Results are emitted as compact JSON: they are read by MCP clients/LLMs, so
+# indentation only costs encoder time and bytes on the transport
+try:
+    import orjson
 
-def get_tools(slack_client: SlackClient) -> list[Tool]:
-    """Get list of available MCP tools.
+    def _encode(obj: Any) -> str:
+        """Serialize a tool result as compact JSON (orjson fast path)."""
+        return orjson.dumps(obj).decode()
 
-    Args:
-        slack_client: Initialized SlackClient instance.
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    import json
 
-    Returns:
-        List of Tool definitions.
+    def _encode(obj: Any) -> str:
+        """Serialize a tool result as compact JSON."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _text_content(text: str) -> TextContent:
+    """Build a text result without re-running pydantic validation.
+
+    Every body is either a literal message or encoder output, so the model is
+    always valid and model_construct can skip the per-response validation pass.
     """
-    return [
-        Tool(
-            name="slack_list_channels",
-            description="List all channels in the Slack workspace",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
+    return TextContent.model_construct(type="text", text=text)
+
+
+# Upper bound on concurrent Slack requests issued by a single batch tool call
+# Keeps fan-out within Slack's per-method rate limits
+_BATCH_CONCURRENCY = 20
+
+
+# -------------------------
+# Tool schemas
+# -------------------------
+def _obj(properties: dict[str, Any], required: list[str]) -> dict[str, Any]:
+    """JSON Schema for a tool's argument object."""
+    return {"type": "object", "properties": properties, "required": required}
+
+
+def _str(description: str) -> dict[str, Any]:
+    return {"type": "string", "description": description}
+
+
+def _str_array(description: str) -> dict[str, Any]:
+    return {"type": "array", "items": {"type": "string"}, "description": description}
+
+
+def _int(description: str, default: int) -> dict[str, Any]:
+    return {"type": "integer", "description": description, "default": default}
+
+
+# Tool definitions never depend on the client, so they are built once at import
+# time and shared; the tuple keeps the shared sequence itself immutable
+_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="slack_list_channels",
+        description="List all channels in the Slack workspace",
+        inputSchema=_obj({}, []),
+    ),
+    Tool(
+        name="slack_get_channel_info",
+        description="Get information about a specific Slack channel",
+        inputSchema=_obj(
+            {"channel_id": _str("The channel ID (e.g., C1234567890)")},
+            ["channel_id"],
         ),
-        Tool(
-            name="slack_get_channel_info",
-            description="Get information about a specific Slack channel",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "channel_id": {
-                        "type": "string",
-                        "description": "The channel ID (e.g., C1234567890)",
-                    },
-                },
-                "required": ["channel_id"],
-            },
+    ),
+    Tool(
+        name="slack_get_channel_info_batch",
+        description="Get information about several Slack channels in one call",
+        inputSchema=_obj(
+            {"channel_ids": _str_array('The channel IDs (e.g., ["C1234567890", "C0987654321"])')},
+            ["channel_ids"],
         ),
-        Tool(
-            name="slack_send_message",
-            description="Send a message to a Slack channel",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "channel": {
-                        "type": "string",
-                        "description": "Channel ID or name (e.g., C1234567890 or #general)",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "The message text to send",
-                    },
-                },
-                "required": ["channel", "text"],
+    ),
+    Tool(
+        name="slack_send_message",
+        description="Send a message to a Slack channel",
+        inputSchema=_obj(
+            {
+                "channel": _str("Channel ID or name (e.g., C1234567890 or #general)"),
+                "text": _str("The message text to send"),
             },
+            ["channel", "text"],
         ),
-        Tool(
-            name="slack_get_messages",
-            description="Get recent messages from a Slack channel",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "channel": {
-                        "type": "string",
-                        "description": "Channel ID or name",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of messages to retrieve (default: 100)",
-                        "default": 100,
-                    },
-                },
-                "required": ["channel"],
+    ),
+    Tool(
+        name="slack_get_messages",
+        description="Get recent messages from a Slack channel",
+        inputSchema=_obj(
+            {
+                "channel": _str("Channel ID or name"),
+                "limit": _int("Maximum number of messages to retrieve (default: 100)", 100),
             },
+            ["channel"],
         ),
-        Tool(
-            name="slack_list_users",
-            description="List all users in the Slack workspace",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
+    ),
+    Tool(
+        name="slack_list_users",
+        description="List all users in the Slack workspace",
+        inputSchema=_obj({}, []),
+    ),
+    Tool(
+        name="slack_get_user_info",
+        description="Get information about a specific Slack user",
+        inputSchema=_obj(
+            {"user_id": _str("The user ID (e.g., U1234567890)")},
+            ["user_id"],
         ),
-        Tool(
-            name="slack_get_user_info",
-            description="Get information about a specific Slack user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {
-                        "type": "string",
-                        "description": "The user ID (e.g., U1234567890)",
-                    },
-                },
-                "required": ["user_id"],
-            },
+    ),
+    Tool(
+        name="slack_get_user_info_batch",
+        description="Get information about several Slack users in one call",
+        inputSchema=_obj(
+            {"user_ids": _str_array('The user IDs (e.g., ["U1234567890", "U0987654321"])')},
+            ["user_ids"],
         ),
-    ]
+    ),
+    Tool(
+        name="slack_refresh_cache",
+        description="Clear cached channel and user data so the next calls fetch fresh results",
+        inputSchema=_obj({}, []),
+    ),
+)
+
+
+def get_tools(slack_client: SlackClient) -> list[Tool]:
+    """Get list of available MCP tools.
+
+    Tools are built once at import; each call returns a new list over the same
+    shared Tool objects.
+
+    Args:
+        slack_client: Initialized SlackClient instance (kept for API compatibility).
+
+    Returns:
+        List of Tool definitions.
+    """
+    return list(_TOOLS)
+
+
+# -------------------------
+# Result projections
+# -------------------------
+# List results can hold thousands of rows, so dict.get is bound once per call
+# instead of being looked up as an attribute for every field of every row.
+# Channel and user listings are projected straight off the client's page
+# iterator and encoded row by row (see _encode_rows), so neither the raw Slack
+# objects nor the projected rows accumulate: peak memory is two raw pages (the
+# one being projected plus the next, which is prefetched) plus the output text.
+# Required fields come out in one C-level itemgetter call; optional fields
+# need defaults, which itemgetter can't supply, so they use the bound get.
+_id_name = itemgetter("id", "name")
+
+
+async def _project_channels(
+    channels: AsyncGenerator[dict[str, Any], None],
+) -> AsyncIterator[dict[str, Any]]:
+    """Reduce raw channel objects to the fields returned by slack_list_channels."""
+    get = dict.get
+    id_name = _id_name
+    # aclosing() shuts the source (and its page prefetch) down as soon as we stop,
+    # rather than whenever the abandoned generator is garbage collected
+    async with aclosing(channels) as rows:
+        async for ch in rows:
+            ch_id, name = id_name(ch)
+            yield {
+                "id": ch_id,
+                "name": name,
+                "is_private": get(ch, "is_private", False),
+                "is_archived": get(ch, "is_archived", False),
+            }
+
+
+# Messages arrive as one list; rows are replaced in place so the list is reused
+# rather than copied. The input must not be used as raw Slack objects afterwards.
+def _project_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Reduce raw message objects to the fields returned by slack_get_messages."""
+    get = dict.get
+    for i, msg in enumerate(messages):
+        messages[i] = {
+            "ts": msg["ts"],
+            "user": get(msg, "user"),
+            "text": get(msg, "text", ""),
+            "type": get(msg, "type"),
+        }
+    return messages
+
+
+async def _project_users(
+    users: AsyncGenerator[dict[str, Any], None],
+) -> AsyncIterator[dict[str, Any]]:
+    """Reduce raw user objects to the fields returned by slack_list_users."""
+    get = dict.get
+    id_name = _id_name
+    async with aclosing(users) as rows:
+        async for user in rows:
+            user_id, name = id_name(user)
+            yield {
+                "id": user_id,
+                "name": name,
+                "real_name": get(user, "real_name"),
+                "is_bot": get(user, "is_bot", False),
+                "deleted": get(user, "deleted", False),
+            }
+
+
+async def _encode_rows(rows: AsyncIterable[dict[str, Any]]) -> str:
+    """Encode rows as a JSON array one at a time, never holding them all as objects.
+
+    Produces the same text as _encode(list(rows)).
+    """
+    buf = io.StringIO()
+    # Per-row loop: bind the method and encoder to locals once
+    write = buf.write
+    encode = _encode
+    write("[")
+    sep = ""
+    async for row in rows:
+        write(sep)
+        write(encode(row))
+        sep = ","
+    write("]")
+    return buf.getvalue()
+
+
+def _project_channel_info(channel_info: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a raw channel object to the fields returned by slack_get_channel_info."""
+    channel_id, name = _id_name(channel_info)
+    return {
+        "id": channel_id,
+        "name": name,
+        "is_private": channel_info.get("is_private", False),
+        "is_archived": channel_info.get("is_archived", False),
+        "created": channel_info.get("created"),
+        "num_members": channel_info.get("num_members"),
+    }
+
+
+def _project_user_info(user_info: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a raw user object to the fields returned by slack_get_user_info."""
+    user_id, name = _id_name(user_info)
+    # Look the profile up once for both of its fields
+    profile = user_info.get("profile") or {}
+    return {
+        "id": user_id,
+        "name": name,
+        "real_name": user_info.get("real_name"),
+        "display_name": profile.get("display_name"),
+        "email": profile.get("email"),
+        "is_bot": user_info.get("is_bot", False),
+        "deleted": user_info.get("deleted", False),
+    }
+
+
+async def _fetch_batch(
+    ids: list[str],
+    fetch: Callable[[str], Awaitable[Optional[dict[str, Any]]]],
+    project: Callable[[dict[str, Any]], dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Look up many IDs concurrently, returning one entry per ID in input order.
+
+    Duplicate IDs are looked up once. Failed lookups (e.g. unknown IDs, which
+    Slack reports as errors) become {"id": ..., "error": ...} entries instead of
+    failing the whole batch.
+    """
+    slots = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def fetch_one(item_id: str) -> Optional[dict[str, Any]]:
+        async with slots:
+            return await fetch(item_id)
+
+    # LLM-built batches often repeat IDs (e.g. one user per message); fetch each once
+    unique_ids = list(dict.fromkeys(ids))
+    results = await asyncio.gather(*(fetch_one(i) for i in unique_ids), return_exceptions=True)
+
+    by_id: dict[str, dict[str, Any]] = {}
+    for item_id, res in zip(unique_ids, results):
+        if isinstance(res, Exception):
+            by_id[item_id] = {"id": item_id, "error": str(res)}
+        elif isinstance(res, BaseException):
+            # Cancellation (and other BaseExceptions) must propagate, not become an entry
+            raise res
+        else:
+            by_id[item_id] = project(res)
+
+    entries = [by_id[item_id] for item_id in ids]
+    return entries
+
+
+# -------------------------
+# Tool handlers
+# -------------------------
+# Each handler takes the tool arguments and the client; errors propagate to
+# handle_tool_call, which converts them into user-facing text.
+ToolHandler = Callable[[dict[str, Any], SlackClient], Awaitable[list[TextContent]]]
+
+
+async def _handle_list_channels(
+    arguments: dict[str, Any], slack_client: SlackClient
+) -> list[TextContent]:
+    # Stream channels page by page (handles pagination); project and encode as they arrive
+    # Only the compact encoded text is cached, never the raw Slack listing
+    text = await slack_client.cached(
+        ("tool", "slack_list_channels"),
+        lambda: _encode_rows(_project_channels(slack_client.list_channels_iter())),
+    )
+    return [_text_content(text)]
+
+
+async def _handle_get_channel_info(
+    arguments: dict[str, Any], slack_client: SlackClient
+) -> list[TextContent]:
+    channel_id = arguments["channel_id"]
+    channel_info = await slack_client.get_channel_info(channel_id)
+    if channel_info:
+        result = _project_channel_info(channel_info)
+        return [_text_content(_encode(result))]
+    return [_text_content(f"Channel {channel_id} not found")]
+
+
+async def _handle_get_channel_info_batch(
+    arguments: dict[str, Any], slack_client: SlackClient
+) -> list[TextContent]:
+    # Fan out one lookup per channel concurrently instead of N serial tool calls
+    result = await _fetch_batch(
+        arguments["channel_ids"], slack_client.get_channel_info, _project_channel_info
+    )
+    return [_text_content(_encode(result))]
+
+
+async def _handle_send_message(
+    arguments: dict[str, Any], slack_client: SlackClient
+) -> list[TextContent]:
+    channel = arguments["channel"]
+    text = arguments["text"]
+    # Use post_message() instead of send_message()
+    response = await slack_client.post_message(channel, text)
+    result = response._asdict()
+    return [_text_content(_encode(result))]
+
+
+async def _handle_get_messages(
+    arguments: dict[str, Any], slack_client: SlackClient
+) -> list[TextContent]:
+    channel = arguments["channel"]
+    limit = arguments.get("limit", 100)
+    messages = await slack_client.get_messages(channel, limit)
+    result = _project_messages(messages)
+    return [_text_content(_encode(result))]
+
+
+async def _handle_list_users(
+    arguments: dict[str, Any], slack_client: SlackClient
+) -> list[TextContent]:
+    # Stream users page by page (handles pagination); project and encode as they arrive
+    # Only the compact encoded text is cached, never the raw Slack listing
+    text = await slack_client.cached(
+        ("tool", "slack_list_users"),
+        lambda: _encode_rows(_project_users(slack_client.get_users_iter())),
+    )
+    return [_text_content(text)]
+
+
+async def _handle_get_user_info(
+    arguments: dict[str, Any], slack_client: SlackClient
+) -> list[TextContent]:
+    user_id = arguments["user_id"]
+    user_info = await slack_client.get_user_info(user_id)
+    if user_info:
+        result = _project_user_info(user_info)
+        return [_text_content(_encode(result))]
+    return [_text_content(f"User {user_id} not found")]
+
+
+async def _handle_get_user_info_batch(
+    arguments: dict[str, Any], slack_client: SlackClient
+) -> list[TextContent]:
+    # Fan out one lookup per user concurrently instead of N serial tool calls
+    result = await _fetch_batch(
+        arguments["user_ids"], slack_client.get_user_info, _project_user_info
+    )
+    return [_text_content(_encode(result))]
+
+
+async def _handle_refresh_cache(
+    arguments: dict[str, Any], slack_client: SlackClient
+) -> list[TextContent]:
+    slack_client.clear_cache()
+    return [_text_content("Cache cleared")]
+
+
+# Tool name -> handler; a single dict lookup replaces the if/elif chain
+_DISPATCH: dict[str, ToolHandler] = {
+    "slack_list_channels": _handle_list_channels,
+    "slack_get_channel_info": _handle_get_channel_info,
+    "slack_get_channel_info_batch": _handle_get_channel_info_batch,
+    "slack_send_message": _handle_send_message,
+    "slack_get_messages": _handle_get_messages,
+    "slack_list_users": _handle_list_users,
+    "slack_get_user_info": _handle_get_user_info,
+    "slack_get_user_info_batch": _handle_get_user_info_batch,
+    "slack_refresh_cache": _handle_refresh_cache,
+}
 
 
 async def handle_tool_call(tool_name: str, arguments: dict[str, Any], slack_client: SlackClient) -> list[TextContent]:
@@ -112,105 +425,17 @@ async def handle_tool_call(tool_name: str, arguments: dict[str, Any], slack_clie
     Returns:
         List of TextContent with the results.
     """
-    import json
+    handler = _DISPATCH.get(tool_name)
+    if handler is None:
+        return [_text_content(f"Unknown tool: {tool_name}")]
 
     try:
-        if tool_name == "slack_list_channels":
-            # Use list_channels_all() to get all channels (handles pagination)
-            channels = slack_client.list_channels_all()
-            result = [
-                {
-                    "id": ch["id"],
-                    "name": ch["name"],
-                    "is_private": ch.get("is_private", False),
-                    "is_archived": ch.get("is_archived", False),
-                }
-                for ch in channels
-            ]
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif tool_name == "slack_get_channel_info":
-            channel_id = arguments["channel_id"]
-            channel_info = slack_client.get_channel_info(channel_id)
-            if channel_info:
-                result = {
-                    "id": channel_info["id"],
-                    "name": channel_info["name"],
-                    "is_private": channel_info.get("is_private", False),
-                    "is_archived": channel_info.get("is_archived", False),
-                    "created": channel_info.get("created"),
-                    "num_members": channel_info.get("num_members"),
-                }
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-            else:
-                return [TextContent(type="text", text=f"Channel {channel_id} not found")]
-
-        elif tool_name == "slack_send_message":
-            channel = arguments["channel"]
-            text = arguments["text"]
-            # Use post_message() instead of send_message()
-            response = slack_client.post_message(channel, text)
-            result = {
-                "ok": response.get("ok", False),
-                "channel": response.get("channel"),
-                "ts": response.get("ts"),
-                "message": response.get("message", {}),
-            }
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif tool_name == "slack_get_messages":
-            channel = arguments["channel"]
-            limit = arguments.get("limit", 100)
-            messages = slack_client.get_messages(channel, limit)
-            result = [
-                {
-                    "ts": msg["ts"],
-                    "user": msg.get("user"),
-                    "text": msg.get("text", ""),
-                    "type": msg.get("type"),
-                }
-                for msg in messages
-            ]
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif tool_name == "slack_list_users":
-            # Use get_users_all() to get all users (handles pagination)
-            users = slack_client.get_users_all()
-            result = [
-                {
-                    "id": user["id"],
-                    "name": user["name"],
-                    "real_name": user.get("real_name"),
-                    "is_bot": user.get("is_bot", False),
-                    "deleted": user.get("deleted", False),
-                }
-                for user in users
-            ]
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif tool_name == "slack_get_user_info":
-            user_id = arguments["user_id"]
-            user_info = slack_client.get_user_info(user_id)
-            if user_info:
-                result = {
-                    "id": user_info["id"],
-                    "name": user_info["name"],
-                    "real_name": user_info.get("real_name"),
-                    "display_name": user_info.get("profile", {}).get("display_name"),
-                    "email": user_info.get("profile", {}).get("email"),
-                    "is_bot": user_info.get("is_bot", False),
-                    "deleted": user_info.get("deleted", False),
-                }
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-            else:
-                return [TextContent(type="text", text=f"User {user_id} not found")]
-
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {tool_name}")]
-
+        return await handler(arguments, slack_client)
     except SlackMCPError as e:
         # Handle Slack-specific errors with user-friendly messages
-        return [TextContent(type="text", text=f"Slack error: {str(e)}")]
+        return [_text_content(f"Slack error: {str(e)}")]
     except Exception as e:
-        # Handle unexpected errors
-        return [TextContent(type="text", text=f"Error: {str(e)}")]
+        # Handle unexpected errors; the type name makes bare messages like "'channel'"
+        # (a KeyError for a missing argument) intelligible
+        # CancelledError derives from BaseException, so cancellation still propagates
+        return [_text_content(f"Error: {type(e).__name__}: {e}")]